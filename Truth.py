@@ -2,14 +2,40 @@
 """
 truth_cyrillic.py - Analyse complète d'un mot cyrillique
 Affiche les conversions, propriétés mathématiques, hashs, etc. pour un texte cyrillique
+
+Le module est en Python pur (stdlib seulement, Numba et xxhash facultatifs) :
+`pypy3 Truth.py ...` fonctionne tel quel, et le JIT traceur de PyPy compile
+nativement les boucles entières de factorize/is_prime sans modification.
 """
 
+import array
 import math
+import functools
 import hashlib
-import crcmod
+import types
 import base64
 from datetime import datetime
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    # Noyaux compilés en C (voir truth_math.pyx ; python setup.py build_ext --inplace)
+    import truth_math
+except ImportError:
+    truth_math = None
+
+try:
+    import numba
+except ImportError:
+    # Numba est optionnel : sans lui, les boucles restent en Python pur
+    numba = None
+
+try:
+    import xxhash
+except ImportError:
+    # xxhash est optionnel : sans lui, l'empreinte rapide retombe sur MD5
+    xxhash = None
 
 # Alphabet cyrillique complet
 ALPHABET_CYRILLIQUE = {
@@ -19,58 +45,108 @@ ALPHABET_CYRILLIQUE = {
     'Э': 31, 'Ю': 32, 'Я': 33
 }
 
-ALPHABET_INVERSE = {v: k for k, v in ALPHABET_CYRILLIQUE.items()}
+# Table inverse indexée directement par le code 1..33 : le dict conserve
+# l'ordre d'insertion, donc tuple(ALPHABET_CYRILLIQUE) donne А..Я en ordre
+# de code et l'indexation se fait sans hachage
+ALPHABET_INVERSE = (None,) + tuple(ALPHABET_CYRILLIQUE)
+
+# Même alphabet à plat : CHARS[code - 1] donne la lettre, dans une seule
+# chaîne contiguë plutôt qu'un conteneur d'objets str d'un caractère
+CHARS = ''.join(ALPHABET_CYRILLIQUE)
+
+class _TableSuppression(dict):
+    """
+    Table pour str.translate qui supprime par défaut : tout point de code
+    absent de la table est effacé au lieu de passer tel quel (translate
+    laisse intacts les caractères non répertoriés, ce qui laisserait fuir
+    tirets longs, emojis ou cyrillique étendu dans la sortie)
+    """
+    def __missing__(self, code):
+        return None
+
+# Table de traduction précalculée pour l'encodage : chaque point de code
+# (cyrillique ou latin, majuscule ou minuscule) est remplacé directement par
+# son code décimal suivi d'un séparateur ; tout autre caractère est supprimé.
+# str.translate exécute la substitution en une seule passe en C.
+TABLE_ENCODAGE = _TableSuppression()
+for _lettre, _numero in ALPHABET_CYRILLIQUE.items():
+    TABLE_ENCODAGE[ord(_lettre)] = f"{_numero}."
+    TABLE_ENCODAGE[ord(_lettre.lower())] = f"{_numero}."
+for _i in range(26):
+    TABLE_ENCODAGE[ord('A') + _i] = f"{_i + 1}."
+    TABLE_ENCODAGE[ord('a') + _i] = f"{_i + 1}."
+del _lettre, _numero, _i
+
+# Tables indexées par ord(c) sur le bloc [0, 0x500) : un index de liste évite
+# le hachage d'un lookup de dict ou le scan d'une chaîne pour chaque lettre.
+CODE_LUT = [0] * 0x500
+for _lettre, _numero in ALPHABET_CYRILLIQUE.items():
+    CODE_LUT[ord(_lettre)] = _numero
+    CODE_LUT[ord(_lettre.lower())] = _numero
+
+CODE_LATIN_LUT = [0] * 0x500
+for _i in range(26):
+    CODE_LATIN_LUT[ord('A') + _i] = CODE_LATIN_LUT[ord('a') + _i] = _i + 1
+del _i
+
+VOYELLE_LUT = bytearray(0x500)
+CONSONNE_LUT = bytearray(0x500)
+for _lettre in 'АЕЁИОУЫЭЮЯ':
+    VOYELLE_LUT[ord(_lettre)] = VOYELLE_LUT[ord(_lettre.lower())] = 1
+for _lettre in 'БВГДЖЗЙКЛМНПРСТФХЦЧШЩ':
+    CONSONNE_LUT[ord(_lettre)] = CONSONNE_LUT[ord(_lettre.lower())] = 1
+del _lettre, _numero
+
+# Tables de suppression dérivées des LUT : seules les voyelles (resp.
+# consonnes) sont conservées, __missing__ efface tout le reste — y compris
+# les points de code hors du bloc [0, 0x500). translate() fait la passe en C,
+# il ne reste qu'à mesurer la longueur du résultat
+SUPPR_NON_VOYELLES = _TableSuppression(
+    (i, i) for i in range(0x500) if VOYELLE_LUT[i])
+SUPPR_NON_CONSONNES = _TableSuppression(
+    (i, i) for i in range(0x500) if CONSONNE_LUT[i])
 
 def encoder_mot_cyrillique(mot):
     """
     Encode un mot cyrillique en séquence numérique
     """
-    mot = mot.upper().strip()
-    resultat = []
-    
-    for lettre in mot:
-        if lettre in ALPHABET_CYRILLIQUE:
-            numero = ALPHABET_CYRILLIQUE[lettre]
-            resultat.append(str(numero))
-        elif lettre.isalpha():
-            # Si c'est une lettre latine
-            numero = ord(lettre) - ord('A') + 1
-            resultat.append(str(numero))
-    
-    return '.'.join(resultat)
+    return mot.strip().translate(TABLE_ENCODAGE).rstrip('.')
 
 def decoder_sequence_cyrillique(sequence):
     """
     Décode une séquence numérique en mot cyrillique
     """
-    nombres = sequence.split('.')
-    mot_decode = []
-    
-    for nombre in nombres:
-        if nombre.isdigit():
-            numero = int(nombre)
-            if 1 <= numero <= 33:
-                lettre = ALPHABET_INVERSE[numero]
-                mot_decode.append(lettre)
-            elif 1 <= numero <= 26:
-                # Lettre latine
-                lettre = chr(numero + ord('A') - 1)
-                mot_decode.append(lettre)
-    
-    return ''.join(mot_decode)
+    tokens = sequence.split('.')
+    try:
+        nombres = list(map(int, tokens))
+    except ValueError:
+        # Séquence mal formée : on ignore les segments non numériques
+        nombres = [int(t) for t in tokens if t.isdigit()]
+    return ''.join([CHARS[n - 1] for n in nombres if 1 <= n <= 33])
+
+def codes_cyrilliques(mot):
+    """
+    Extrait les codes 1..33 des lettres cyrilliques d'un mot
+
+    Accumule dans un array('B') compact : un octet par code au lieu d'un
+    objet Python par lettre, ce qui reste local en cache pour les longs
+    textes.
+    """
+    codes = array.array('B')
+    lut = CODE_LUT
+    ajouter = codes.append
+    for o in map(ord, mot):
+        if o < 0x500:
+            c = lut[o]
+            if c:
+                ajouter(c)
+    return codes
 
 def mot_vers_nombre(mot):
     """
     Convertit un mot cyrillique en un nombre unique (somme des codes)
     """
-    mot = mot.upper().strip()
-    total = 0
-    
-    for lettre in mot:
-        if lettre in ALPHABET_CYRILLIQUE:
-            total += ALPHABET_CYRILLIQUE[lettre]
-    
-    return total
+    return sum(codes_cyrilliques(mot))
 
 def sequence_vers_nombre(sequence):
     """
@@ -88,12 +164,20 @@ def sequence_vers_nombre(sequence):
 def analyser_mot_cyrillique(mot):
     """
     Analyse complète d'un mot cyrillique
+
+    Les analyses sont mémoïsées par mot (clé : entrée sans espaces de bord)
+    et renvoyées en lecture seule pour que le cache ne soit jamais modifié.
     """
+    return _analyser_mot_cache(mot.strip())
+
+@functools.lru_cache(maxsize=256)
+def _analyser_mot_cache(mot):
     results = {}
     
-    # Informations de base
+    # Informations de base (une seule conversion de casse pour toute l'analyse)
+    mot_u = mot.upper()
     results['mot_original'] = mot
-    results['mot_majuscules'] = mot.upper()
+    results['mot_majuscules'] = mot_u
     results['mot_minuscules'] = mot.lower()
     results['longueur_mot'] = len(mot)
     
@@ -105,34 +189,50 @@ def analyser_mot_cyrillique(mot):
     results['mot_decode'] = decoder_sequence_cyrillique(results['sequence_cyrillique'])
     
     # Propriétés du texte
-    results['est_palindrome'] = est_palindrome(mot)
-    results['nombre_voyelles'] = compter_voyelles_cyrilliques(mot)
-    results['nombre_consonnes'] = compter_consonnes_cyrilliques(mot)
-    results['lettres_uniques'] = lettres_uniques(mot)
+    results['est_palindrome'] = est_palindrome(mot_u)
+    results['nombre_voyelles'] = compter_voyelles_cyrilliques(mot_u)
+    results['nombre_consonnes'] = compter_consonnes_cyrilliques(mot_u)
+    results['lettres_uniques'] = lettres_uniques(mot_u)
     
     # Analyse numérique basée sur la valeur totale
     nombre = results['valeur_numerique']
     results.update(analyser_nombre(nombre))
     
-    return results
+    return types.MappingProxyType(results)
+
+def _digit_sum(n):
+    # Somme des chiffres en pure arithmétique : pas de chaîne intermédiaire
+    # ni d'objet int créé par chiffre comme avec sum(int(d) for d in str(n))
+    s = 0
+    while n:
+        s += n % 10
+        n //= 10
+    return s
 
 def analyser_nombre(nombre):
     """
     Analyse complète d'un nombre (adaptée de truth.py)
+
+    Le résultat étant entièrement déterminé par le nombre, il est mémoïsé :
+    deux mots différents donnant la même valeur partagent le même calcul.
     """
+    return dict(_analyser_nombre_cache(nombre))
+
+@functools.lru_cache(maxsize=4096)
+def _analyser_nombre_cache(nombre):
     results = {}
     
     # Conversion de base
     results['decimal'] = nombre
-    results['hexadecimal'] = hex(nombre)[2:].upper()
-    results['binary'] = bin(nombre)[2:]
-    results['octal'] = oct(nombre)[2:]
+    results['hexadecimal'] = f"{nombre:X}"
+    results['binary'] = f"{nombre:b}"
+    results['octal'] = f"{nombre:o}"
     
     # Propriétés mathématiques
     results['parity'] = "Odd" if nombre % 2 else "Even"
     results['factors'] = factorize(nombre)
     results['prime_status'] = "Prime" if is_prime(nombre) else "Composite"
-    results['digit_sum'] = sum(int(d) for d in str(nombre))
+    results['digit_sum'] = _digit_sum(nombre)
     results['digit_count'] = len(str(nombre))
     results['square'] = nombre ** 2
     results['cube'] = nombre ** 3
@@ -145,52 +245,138 @@ def analyser_nombre(nombre):
     
     return results
 
+def analyser_nombres_batch(nombres):
+    """
+    Analyse une liste de nombres en un seul passage
+
+    Grâce au cache d'analyser_nombre, chaque valeur distincte du lot n'est
+    factorisée et hachée qu'une seule fois.
+    """
+    return [analyser_nombre(n) for n in nombres]
+
+def empreinte_rapide(nombre):
+    """
+    Empreinte non cryptographique rapide d'un nombre
+
+    Utilise xxhash (XXH3, vectorisé) quand il est installé, sinon retombe
+    sur MD5 — à réserver aux usages où seul un identifiant compact compte.
+    """
+    message = str(nombre).encode()
+    if xxhash is not None:
+        return xxhash.xxh3_64(message).hexdigest()
+    return hashlib.md5(message).hexdigest()
+
+def _analyser_mot_vers_dict(mot):
+    # Les MappingProxyType ne se picklent pas : version dict pour les workers
+    return dict(analyser_mot_cyrillique(mot))
+
+def analyser_batch(mots):
+    """
+    Analyse une liste de mots en parallèle
+
+    Chaque analyse est indépendante et bornée par le CPU (hashs, division
+    d'essai), donc un pool de processus passe à l'échelle du nombre de
+    cœurs malgré le GIL.
+    """
+    if len(mots) < 2:
+        return [_analyser_mot_vers_dict(mot) for mot in mots]
+    chunksize = max(1, len(mots) // (4 * (os.cpu_count() or 1)))
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(_analyser_mot_vers_dict, mots, chunksize=chunksize))
+
 def est_palindrome(mot):
-    """Vérifie si le mot est un palindrome"""
-    mot = mot.upper().replace(' ', '')
-    return mot == mot[::-1]
+    """Vérifie si le mot (déjà en majuscules) est un palindrome"""
+    # Balayage symétrique à deux index : sortie dès la première différence,
+    # sans allouer la copie inversée de mot[::-1]
+    mot = mot.replace(' ', '')
+    i, j = 0, len(mot) - 1
+    while i < j:
+        if mot[i] != mot[j]:
+            return False
+        i += 1
+        j -= 1
+    return True
 
 def compter_voyelles_cyrilliques(mot):
     """Compte les voyelles cyrilliques"""
-    voyelles = 'АЕЁИОУЫЭЮЯ'
-    mot = mot.upper()
-    return sum(1 for lettre in mot if lettre in voyelles)
+    return len(mot.translate(SUPPR_NON_VOYELLES))
 
 def compter_consonnes_cyrilliques(mot):
     """Compte les consonnes cyrilliques"""
-    consonnes = 'БВГДЖЗЙКЛМНПРСТФХЦЧШЩ'
-    mot = mot.upper()
-    return sum(1 for lettre in mot if lettre in consonnes)
+    return len(mot.translate(SUPPR_NON_CONSONNES))
 
 def lettres_uniques(mot):
-    """Retourne les lettres uniques du mot"""
-    return ''.join(sorted(set(mot.upper())))
+    """Retourne les lettres uniques du mot (déjà en majuscules)"""
+    # Trier des points de code entiers évite une comparaison de chaînes
+    # unicode par échange du tri
+    return ''.join(map(chr, sorted({ord(c) for c in mot})))
 
-def factorize(n):
-    """Factorise un nombre"""
+def _factorize_py(n):
+    # Roue 6k±1 : après 2 et 3, tous les premiers sont de la forme 6k±1,
+    # donc on alterne les pas 2 et 4 et on saute ~2/3 des candidats
     if n < 2:
         return [n]
-    
+
     factors = []
-    d = 2
+    while n % 2 == 0:
+        factors.append(2)
+        n //= 2
+    while n % 3 == 0:
+        factors.append(3)
+        n //= 3
+    d = 5
+    pas = 2
     while d * d <= n:
         while n % d == 0:
             factors.append(d)
             n //= d
-        d += 1
+        d += pas
+        pas = 6 - pas
     if n > 1:
         factors.append(n)
     return factors
 
-def is_prime(n):
-    """Vérifie si un nombre est premier"""
+def _is_prime_py(n):
     if n < 2:
         return False
-    for i in range(2, int(math.sqrt(n)) + 1):
-        if n % i == 0:
+    if n % 2 == 0:
+        return n == 2
+    if n % 3 == 0:
+        return n == 3
+    d = 5
+    pas = 2
+    while d * d <= n:
+        if n % d == 0:
             return False
+        d += pas
+        pas = 6 - pas
     return True
 
+if numba is not None:
+    # Compilation native des boucles de division d'essai ; cache=True évite
+    # de repayer la compilation à chaque lancement du script
+    _factorize_nb = numba.njit(cache=True)(_factorize_py)
+    _is_prime_nb = numba.njit(cache=True)(_is_prime_py)
+
+def factorize(n):
+    """Factorise un nombre"""
+    if -2**63 <= n < 2**63:
+        if truth_math is not None:
+            return truth_math.factorize(n)
+        if numba is not None:
+            return list(_factorize_nb(n))
+    return _factorize_py(n)
+
+@functools.lru_cache(maxsize=4096)
+def is_prime(n):
+    """Vérifie si un nombre est premier"""
+    if -2**63 <= n < 2**63:
+        if truth_math is not None:
+            return truth_math.is_prime(n)
+        if numba is not None:
+            return bool(_is_prime_nb(n))
+    return _is_prime_py(n)
+
 def afficher_table_cyrillique():
     """Affiche la table de correspondance cyrillique"""
     print("\n" + "="*60)
@@ -251,22 +437,28 @@ def afficher_resultats(results):
     
     # Affichage détaillé de l'encodage
     print("\nDÉTAIL DE L'ENCODAGE LETTRE PAR LETTRE")
-    mot = results['mot_original'].upper()
+    mot = results['mot_majuscules']
     for i, lettre in enumerate(mot):
-        if lettre in ALPHABET_CYRILLIQUE:
-            code = ALPHABET_CYRILLIQUE[lettre]
+        # Une comparaison entière par lettre via les LUT, sans dict ni isalpha()
+        o = ord(lettre)
+        code = CODE_LUT[o] if o < 0x500 else 0
+        if code:
             print(f"    {i+1:2d}. {lettre} = {code:2d}")
-        elif lettre.isalpha():
-            code = ord(lettre) - ord('A') + 1
-            print(f"    {i+1:2d}. {lettre} (latin) = {code:2d}")
+        elif o < 0x500 and CODE_LATIN_LUT[o]:
+            print(f"    {i+1:2d}. {lettre} (latin) = {CODE_LATIN_LUT[o]:2d}")
         else:
             print(f"    {i+1:2d}. {lettre} (autre)")
 
 def main():
+    if len(sys.argv) == 3 and sys.argv[1] == '--batch':
+        analyser_fichier_batch(sys.argv[2])
+        return
+
     if len(sys.argv) != 2:
         print("Usage: python truth_cyrillic.py <mot_cyrillique>")
         print("Exemple: python truth_cyrillic.py ПРИВЕТ")
         print("Exemple: python truth_cyrillic.py \"16.1.25.19\" (pour décoder)")
+        print("Exemple: python truth_cyrillic.py --batch mots.txt (un mot par ligne)")
         sys.exit(1)
     
     entree = sys.argv[1].strip()
@@ -291,6 +483,21 @@ def main():
         print(f"❌ Erreur : {e}")
         sys.exit(1)
 
+def analyser_fichier_batch(chemin):
+    """
+    Analyse en parallèle tous les mots d'un fichier (un par ligne)
+    """
+    try:
+        with open(chemin, encoding='utf-8') as fichier:
+            mots = [ligne.strip() for ligne in fichier if ligne.strip()]
+    except OSError as e:
+        print(f"❌ Erreur : {e}")
+        sys.exit(1)
+
+    for results in analyser_batch(mots):
+        print(f"{results['mot_original']} : {results['sequence_cyrillique']} "
+              f"(valeur {results['valeur_numerique']}, {results['prime_status']})")
+
 def interface_interactive():
     """
     Interface interactive pour analyser plusieurs mots
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""
+Compilation optionnelle des noyaux arithmétiques (truth_math.pyx) :
+
+    python setup.py build_ext --inplace
+
+Les scripts fonctionnent sans cette étape, en Python pur.
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name='truth-math',
+    ext_modules=cythonize('truth_math.pyx', language_level=3),
+)
@@ -5,12 +5,20 @@ Affiche les conversions, propriétés mathématiques, hashs, etc.
 """
 
 import math
+import re
+import functools
 import hashlib
-import crcmod
+import zlib
 import base64
 from datetime import datetime
 import sys
 
+try:
+    import numba
+except ImportError:
+    # Numba est optionnel : sans lui, les noyaux restent en Python pur
+    numba = None
+
 # Alphabet cyrillique complet
 ALPHABET_CYRILLIQUE = {
     'А': 1, 'Б': 2, 'В': 3, 'Г': 4, 'Д': 5, 'Е': 6, 'Ё': 7, 'Ж': 8, 'З': 9, 'И': 10,
@@ -19,25 +27,42 @@ ALPHABET_CYRILLIQUE = {
     'Э': 31, 'Ю': 32, 'Я': 33
 }
 
-ALPHABET_INVERSE = {v: k for k, v in ALPHABET_CYRILLIQUE.items()}
+# Table inverse dense : _INV[code] donne la lettre par simple indexation de
+# liste (le dict préserve l'ordre d'insertion, donc l'ordre des codes)
+_INV = [''] + list(ALPHABET_CYRILLIQUE)
+
+# Détection « séquence pointée » (ex. 17.18.10) en une seule passe du moteur
+# d'expressions régulières, au lieu d'un scan pour '.' puis d'un all(isdigit)
+_SEQ_RE = re.compile(r'\d+(?:\.\d+)+\Z')
+
+class _TableSuppression(dict):
+    """
+    Table pour str.translate qui supprime par défaut : translate laisse
+    passer tels quels les points de code absents de la table, donc sans
+    __missing__ un tiret long, un emoji ou du cyrillique étendu fuirait
+    dans la séquence numérique
+    """
+    def __missing__(self, code):
+        return None
+
+# Table de traduction précalculée : chaque point de code cyrillique ou latin
+# (dans les deux casses) devient directement son code décimal suivi du
+# séparateur, tout autre caractère est supprimé. L'encodage entier
+# s'exécute alors en une passe C de str.translate.
+_ENCODE_TABLE = _TableSuppression()
+for _lettre, _numero in ALPHABET_CYRILLIQUE.items():
+    _ENCODE_TABLE[ord(_lettre)] = f"{_numero}."
+    _ENCODE_TABLE[ord(_lettre.lower())] = f"{_numero}."
+for _i in range(26):
+    _ENCODE_TABLE[ord('A') + _i] = f"{_i + 1}."
+    _ENCODE_TABLE[ord('a') + _i] = f"{_i + 1}."
+del _lettre, _numero, _i
 
 def encoder_mot_cyrillique(mot):
     """
     Encode un mot cyrillique en séquence numérique
     """
-    mot = mot.upper().strip()
-    resultat = []
-    
-    for lettre in mot:
-        if lettre in ALPHABET_CYRILLIQUE:
-            numero = ALPHABET_CYRILLIQUE[lettre]
-            resultat.append(str(numero))
-        elif lettre.isalpha():
-            # Si c'est une lettre latine
-            numero = ord(lettre) - ord('A') + 1
-            resultat.append(str(numero))
-    
-    return '.'.join(resultat)
+    return mot.strip().translate(_ENCODE_TABLE).rstrip('.')
 
 def decoder_sequence_cyrillique(sequence):
     """
@@ -50,7 +75,7 @@ def decoder_sequence_cyrillique(sequence):
         if nombre.isdigit():
             numero = int(nombre)
             if 1 <= numero <= 33:
-                lettre = ALPHABET_INVERSE[numero]
+                lettre = _INV[numero]
                 mot_decode.append(lettre)
             elif 1 <= numero <= 26:
                 # Lettre latine
@@ -61,9 +86,9 @@ def decoder_sequence_cyrillique(sequence):
 
 def mot_vers_nombre(mot):
     """
-    Convertit un mot cyrillique en un nombre unique (somme des codes)
+    Convertit un mot cyrillique (déjà en majuscules) en un nombre unique
+    (somme des codes)
     """
-    mot = mot.upper().strip()
     total = 0
     
     for lettre in mot:
@@ -85,43 +110,90 @@ def sequence_vers_nombre(sequence):
     
     return total
 
-def analyser_mot_cyrillique(mot):
+def analyser_mot_cyrillique_light(mot):
     """
-    Analyse complète d'un mot cyrillique
+    Analyse allégée d'un mot cyrillique : linguistique, encodage et MD5
+
+    Couvre exactement ce qu'affiche le résumé interactif, sans déclencher
+    l'analyse numérique complète (factorisation, premiers précédents,
+    trigonométrie, hashs) qui n'est calculée que sur demande.
     """
     results = {}
     
     # Informations de base
+    mot_upper = mot.upper()
     results['mot_original'] = mot
-    results['mot_majuscules'] = mot.upper()
+    results['mot_majuscules'] = mot_upper
     results['mot_minuscules'] = mot.lower()
     results['longueur_mot'] = len(mot)
     
     # Encodage cyrillique
     results['sequence_cyrillique'] = encoder_mot_cyrillique(mot)
-    results['valeur_numerique'] = mot_vers_nombre(mot)
+    results['valeur_numerique'] = mot_vers_nombre(mot_upper)
     
     # Décodage (pour vérification)
     results['mot_decode'] = decoder_sequence_cyrillique(results['sequence_cyrillique'])
     
     # Propriétés du texte
-    results['est_palindrome'] = est_palindrome(mot)
-    results['nombre_voyelles'] = compter_voyelles_cyrilliques(mot)
-    results['nombre_consonnes'] = compter_consonnes_cyrilliques(mot)
-    results['lettres_uniques'] = lettres_uniques(mot)
+    results['est_palindrome'] = est_palindrome(mot_upper.replace(' ', ''))
+    results['nombre_voyelles'] = compter_voyelles_cyrilliques(mot_upper)
+    results['nombre_consonnes'] = compter_consonnes_cyrilliques(mot_upper)
+    results['lettres_uniques'] = lettres_uniques(mot_upper)
+    
+    # MD5 de la valeur, seul élément du résumé issu de l'analyse numérique
+    results['md5'] = hashlib.md5(str(results['valeur_numerique']).encode()).hexdigest()
+    
+    return results
+
+def analyser_mot_cyrillique(mot):
+    """
+    Analyse complète d'un mot cyrillique
+    """
+    results = analyser_mot_cyrillique_light(mot)
     
     # Analyse numérique basée sur la valeur totale
-    nombre = results['valeur_numerique']
-    results.update(analyser_nombre(nombre))
+    results.update(analyser_nombre(results['valeur_numerique']))
     
     return results
 
+def _digit_sum_py(n):
+    # Somme des chiffres par divmod : pure arithmétique entière, sans objet
+    # str ni int intermédiaire par chiffre
+    s = 0
+    while n:
+        n, d = divmod(n, 10)
+        s += d
+    return s
+
+def _digit_sum(n):
+    if numba is not None and n < 2**63:
+        return int(_digit_sum_nb(n))
+    return _digit_sum_py(n)
+
+@functools.lru_cache(maxsize=360)
+def _trig_deg(degres):
+    # radians() n'est calculé qu'une fois pour les trois fonctions
+    rad = math.radians(degres)
+    return math.sin(rad), math.cos(rad), math.tan(rad)
+
 def analyser_nombre(nombre):
     """
     Analyse complète d'un nombre (adaptée de truth.py)
+
+    Déterministe en fonction du nombre seul, donc mémoïsée : les mots
+    différents qui se somment à la même valeur partagent l'analyse.
     """
+    return dict(_analyser_nombre_cache(nombre))
+
+@functools.lru_cache(maxsize=4096)
+def _analyser_nombre_cache(nombre):
     results = {}
     
+    # Représentation textuelle et octets à hacher, construits une seule fois
+    # et partagés par tous les consommateurs
+    s = str(nombre)
+    b = s.encode()
+    
     # Conversion de base
     results['decimal'] = nombre
     results['hexadecimal'] = hex(nombre)[2:].upper()
@@ -137,8 +209,8 @@ def analyser_nombre(nombre):
     results['multiplied_by_2'] = nombre * 2
     results['divided_by_2'] = nombre / 2
     results['previous_primes'] = find_previous_primes(nombre, 8)
-    results['digit_sum'] = sum(int(d) for d in str(nombre))
-    results['digit_count'] = len(str(nombre))
+    results['digit_sum'] = _digit_sum(nombre)
+    results['digit_count'] = len(s)
     results['log10'] = math.log10(nombre) if nombre > 0 else float('inf')
     results['natural_log'] = math.log(nombre) if nombre > 0 else float('inf')
     results['fibonacci'] = is_fibonacci(nombre)
@@ -151,10 +223,8 @@ def analyser_nombre(nombre):
     results['square_root'] = math.sqrt(nombre) if nombre >= 0 else float('nan')
     results['cube_root'] = nombre ** (1/3)
     
-    # Trigonométrie
-    results['sin_deg'] = math.sin(math.radians(nombre))
-    results['cos_deg'] = math.cos(math.radians(nombre))
-    results['tan_deg'] = math.tan(math.radians(nombre))
+    # Trigonométrie (fonctions en degrés périodiques : cache sur n % 360)
+    results['sin_deg'], results['cos_deg'], results['tan_deg'] = _trig_deg(nombre % 360)
     results['sin_rad'] = math.sin(nombre)
     results['cos_rad'] = math.cos(nombre)
     results['tan_rad'] = math.tan(nombre)
@@ -162,11 +232,10 @@ def analyser_nombre(nombre):
     results['rad_to_deg'] = math.degrees(nombre)
     
     # Hash et cryptographie
-    results['md5'] = hashlib.md5(str(nombre).encode()).hexdigest()
-    results['crc32'] = crc32_hash(str(nombre))
-    results['sha256'] = hashlib.sha256(str(nombre).encode()).hexdigest()
-    results['sha1'] = hashlib.sha1(str(nombre).encode()).hexdigest()
-    results['base64'] = base64.b64encode(str(nombre).encode()).decode()
+    results['md5'] = hashlib.md5(b).hexdigest()
+    results['crc32'] = crc32_hash(b)
+    results['sha256'] = hashlib.sha256(b).hexdigest()
+    results['base64'] = base64.b64encode(b).decode()
     
     # Programmation
     results['c_hex'] = f"0x{results['hexadecimal']}"
@@ -180,32 +249,40 @@ def analyser_nombre(nombre):
     
     # Couleur
     results['color_hex'] = f"#{results['hexadecimal'].zfill(6)}"
-    results['rgb'] = hex_to_rgb(results['hexadecimal'])
+    # RVB par décalages sur la valeur 24 bits, sans repasser par la chaîne hex
+    couleur = nombre & 0xFFFFFF
+    results['rgb'] = ((couleur >> 16) & 0xFF, (couleur >> 8) & 0xFF, couleur & 0xFF)
     
     return results
 
+_UNITS = ("", "один (one)", "два (two)", "три (three)", "четыре (four)", "пять (five)", "шесть (six)", "семь (seven)", "восемь (eight)", "девять (nine)")
+_TEENS = ("десять (ten)", "одиннадцать (eleven)", "двенадцать (twelve)", "тринадцать (thirteen)", "четырнадцать (fourteen)", "пятнадцать (fifteen)", "шестнадцать (sixteen)", "семнадцать (seventeen)", "восемнадцать (eighteen)", "девятнадцать (nineteen)")
+_TENS = ("", "", "двадцать (twenty)", "тридцать (thirty)", "сорок (forty)", "пятьдесят (fifty)", "шестьдесят (sixty)", "семьдесят (seventy)", "восемьдесят (eighty)", "девяносто (ninety)")
+_THOUSANDS = ("", "тысяча (thousand)", "миллион (million)", "миллиард (billion)")
+
+def _convert_hundreds(num):
+    # Version itérative : au plus trois segments (centaines, dizaines,
+    # unités) assemblés sans récursion
+    parts = []
+    if num >= 100:
+        parts.append(_UNITS[num // 100] + " сто (hundred)")
+        num %= 100
+    if num >= 20:
+        if num % 10:
+            parts.append(_TENS[num // 10] + " " + _UNITS[num % 10])
+        else:
+            parts.append(_TENS[num // 10])
+    elif num >= 10:
+        parts.append(_TEENS[num - 10])
+    elif num > 0:
+        parts.append(_UNITS[num])
+    return " ".join(parts)
+
+@functools.lru_cache(maxsize=1024)
 def number_to_english(n):
     """Convertit un nombre en mots anglais"""
     if n == 0:
         return "ноль (zero)"
-    
-    units = ["", "один (one)", "два (two)", "три (three)", "четыре (four)", "пять (five)", "шесть (six)", "семь (seven)", "восемь (eight)", "девять (nine)"]
-    teens = ["десять (ten)", "одиннадцать (eleven)", "двенадцать (twelve)", "тринадцать (thirteen)", "четырнадцать (fourteen)", "пятнадцать (fifteen)", "шестнадцать (sixteen)", "семнадцать (seventeen)", "восемнадцать (eighteen)", "девятнадцать (nineteen)"]
-    tens = ["", "", "двадцать (twenty)", "тридцать (thirty)", "сорок (forty)", "пятьдесят (fifty)", "шестьдесят (sixty)", "семьдесят (seventy)", "восемьдесят (eighty)", "девяносто (ninety)"]
-    thousands = ["", "тысяча (thousand)", "миллион (million)", "миллиард (billion)"]
-    
-    def convert_hundreds(num):
-        if num == 0:
-            return ""
-        elif num < 10:
-            return units[num]
-        elif num < 20:
-            return teens[num - 10]
-        elif num < 100:
-            return tens[num // 10] + (" " + units[num % 10] if num % 10 != 0 else "")
-        else:
-            return units[num // 100] + " сто (hundred)" + (" " + convert_hundreds(num % 100) if num % 100 != 0 else "")
-    
     if n < 0:
         return "отрицательный (negative) " + number_to_english(-n)
     
@@ -215,9 +292,9 @@ def number_to_english(n):
     while n > 0:
         chunk = n % 1000
         if chunk != 0:
-            part = convert_hundreds(chunk)
+            part = _convert_hundreds(chunk)
             if chunk_count > 0:
-                part += " " + thousands[chunk_count]
+                part += " " + _THOUSANDS[chunk_count]
             parts.append(part)
         n //= 1000
         chunk_count += 1
@@ -225,59 +302,141 @@ def number_to_english(n):
     return " ".join(reversed(parts))
 
 def est_palindrome(mot):
-    """Vérifie si le mot est un palindrome"""
-    mot = mot.upper().replace(' ', '')
-    return mot == mot[::-1]
+    """Vérifie si le mot (déjà en majuscules, sans espaces) est un palindrome"""
+    # Comparaison symétrique par index : s'arrête à la première différence,
+    # sans allouer la copie inversée de mot[::-1]
+    return all(mot[i] == mot[-1 - i] for i in range(len(mot) // 2))
+
+_VOYELLES = frozenset('АЕЁИОУЫЭЮЯ')
+_CONSONNES = frozenset('БВГДЖЗЙКЛМНПРСТФХЦЧШЩ')
 
 def compter_voyelles_cyrilliques(mot):
-    """Compte les voyelles cyrilliques"""
-    voyelles = 'АЕЁИОУЫЭЮЯ'
-    mot = mot.upper()
-    return sum(1 for lettre in mot if lettre in voyelles)
+    """Compte les voyelles cyrilliques (mot déjà en majuscules)"""
+    return sum(1 for lettre in mot if lettre in _VOYELLES)
 
 def compter_consonnes_cyrilliques(mot):
-    """Compte les consonnes cyrilliques"""
-    consonnes = 'БВГДЖЗЙКЛМНПРСТФХЦЧШЩ'
-    mot = mot.upper()
-    return sum(1 for lettre in mot if lettre in consonnes)
+    """Compte les consonnes cyrilliques (mot déjà en majuscules)"""
+    return sum(1 for lettre in mot if lettre in _CONSONNES)
 
 def lettres_uniques(mot):
-    """Retourne les lettres uniques du mot"""
-    return ''.join(sorted(set(mot.upper())))
+    """Retourne les lettres uniques du mot (déjà en majuscules)"""
+    # dict.fromkeys déduplique en une passe ordonnée, le tri ne porte plus
+    # que sur le petit ensemble de lettres distinctes
+    return ''.join(sorted(dict.fromkeys(mot)))
 
-def factorize(n):
-    """Factorise un nombre"""
-    if n < 2:
-        return [n]
-    
+# Roue 2-3-5 : pas successifs entre candidats premiers potentiels à partir
+# de 7, qui sautent tous les multiples de 2, 3 et 5 (~77% des entiers)
+_INCREMENTS_ROUE = (4, 2, 4, 2, 4, 6, 2, 6)
+
+def _factorize_py(n):
     factors = []
-    d = 2
+    for p in (2, 3, 5):
+        while n % p == 0:
+            factors.append(p)
+            n //= p
+    d = 7
+    i = 0
     while d * d <= n:
         while n % d == 0:
             factors.append(d)
             n //= d
-        d += 1
+        d += _INCREMENTS_ROUE[i]
+        i = (i + 1) & 7
     if n > 1:
         factors.append(n)
     return factors
 
+def factorize(n):
+    """Factorise un nombre"""
+    if n < 2:
+        return [n]
+    if numba is not None and n < 2**63:
+        return list(_factorize_nb(n))
+    return _factorize_py(n)
+
+# Témoins suffisants pour que Miller-Rabin soit déterministe sur tout
+# l'intervalle des entiers 64 bits
+_TEMOINS_MILLER_RABIN = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+def _is_prime_petit(n):
+    # Division d'essai sur les impairs seulement, bornée par math.isqrt —
+    # exact sur les grands entiers là où int(math.sqrt(n)) peut arrondir faux
+    if n % 2 == 0:
+        return n == 2
+    for i in range(3, math.isqrt(n) + 1, 2):
+        if n % i == 0:
+            return False
+    return True
+
+if numba is not None:
+    # Compilation native des noyaux entiers ; cache=True amortit le coût de
+    # compilation sur les lancements suivants. Miller-Rabin reste en Python
+    # (pow modulaire sur grands entiers), tout comme is_fibonacci dont les
+    # carrés intermédiaires débordent d'int64.
+    _digit_sum_nb = numba.njit(cache=True)(_digit_sum_py)
+    _factorize_nb = numba.njit(cache=True)(_factorize_py)
+
+    @numba.njit(cache=True)
+    def _is_prime_petit_nb(n):
+        if n % 2 == 0:
+            return n == 2
+        i = 3
+        while i * i <= n:
+            if n % i == 0:
+                return False
+            i += 2
+        return True
+
 def is_prime(n):
     """Vérifie si un nombre est premier"""
     if n < 2:
         return False
-    for i in range(2, int(math.sqrt(n)) + 1):
-        if n % i == 0:
+    # En dessous du million, la division d'essai impaire bat Miller-Rabin
+    if n < 1 << 20:
+        if numba is not None:
+            return bool(_is_prime_petit_nb(n))
+        return _is_prime_petit(n)
+    for p in _TEMOINS_MILLER_RABIN:
+        if n % p == 0:
+            return n == p
+    d = n - 1
+    r = 0
+    while d % 2 == 0:
+        d //= 2
+        r += 1
+    for a in _TEMOINS_MILLER_RABIN:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(r - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
             return False
     return True
 
 def find_previous_primes(n, count):
-    """Trouve les nombres premiers précédents"""
+    """Trouve les nombres premiers précédents (crible segmenté par fenêtres)"""
     primes = []
-    candidate = n - 1
-    while len(primes) < count and candidate > 1:
-        if is_prime(candidate):
-            primes.append(candidate)
-        candidate -= 1
+    haut = n - 1
+    fenetre = 200
+    while len(primes) < count and haut > 1:
+        # Crible de la fenêtre [bas, haut] en bloc plutôt qu'un test de
+        # primalité par candidat ; la fenêtre double si elle ne suffit pas
+        bas = max(2, haut - fenetre + 1)
+        composite = bytearray(haut - bas + 1)
+        for p in range(2, math.isqrt(haut) + 1):
+            debut = max(p * p, ((bas + p - 1) // p) * p)
+            if debut <= haut:
+                composite[debut - bas::p] = b'\x01' * ((haut - debut) // p + 1)
+        for candidat in range(haut, bas - 1, -1):
+            if not composite[candidat - bas]:
+                primes.append(candidat)
+                if len(primes) == count:
+                    break
+        haut = bas - 1
+        fenetre *= 2
     return primes
 
 def is_fibonacci(n):
@@ -288,11 +447,12 @@ def is_fibonacci(n):
     return math.isqrt(x + 4) ** 2 == x + 4 or math.isqrt(x - 4) ** 2 == x - 4
 
 def crc32_hash(data):
-    """Calcule le CRC32"""
-    crc32 = crcmod.predefined.Crc('crc-32')
-    crc32.update(data.encode())
-    return crc32.hexdigest()
+    """Calcule le CRC32 d'octets déjà encodés"""
+    # zlib.crc32 descend dans le C de zlib (accéléré matériellement sur les
+    # plateformes qui le permettent), sans objet Crc à construire par appel
+    return format(zlib.crc32(data) & 0xFFFFFFFF, '08X')
 
+@functools.lru_cache(maxsize=256)
 def unix_to_datetime(timestamp):
     """Convertit un timestamp UNIX en datetime"""
     try:
@@ -308,17 +468,6 @@ def number_to_ipv4(n):
         return f"{(n >> 24) & 0xFF}.{(n >> 16) & 0xFF}.{(n >> 8) & 0xFF}.{n & 0xFF}"
     return "Неверный IPv4 адрес (Invalid IPv4 address)"
 
-def hex_to_rgb(hex_str):
-    """Convertit une valeur hex en RGB"""
-    hex_str = hex_str.zfill(6)
-    try:
-        r = int(hex_str[0:2], 16)
-        g = int(hex_str[2:4], 16)
-        b = int(hex_str[4:6], 16)
-        return (r, g, b)
-    except ValueError:
-        return (0, 0, 0)
-
 def afficher_table_cyrillique():
     """Affiche la table de correspondance cyrillique"""
     print("\n" + "="*60)
@@ -336,102 +485,107 @@ def afficher_table_cyrillique():
 
 def afficher_resultats(results):
     """Affiche les résultats de manière formatée"""
-    print("="*80)
-    print(f"ПОЛНЫЙ АНАЛИЗ КИРИЛЛИЧЕСКОГО СЛОВА: '{results['mot_original']}'")
-    print(f"COMPLETE ANALYSIS OF CYRILLIC WORD: '{results['mot_original']}'")
-    print("="*80)
-    
-    print("\nОБЩАЯ ИНФОРМАЦИЯ (General Information)")
-    print(f"    Исходное слово : {results['mot_original']}")
-    print(f"    В верхнем регистре : {results['mot_majuscules']}")
-    print(f"    В нижнем регистре : {results['mot_minuscules']}")
-    print(f"    Длина слова : {results['longueur_mot']} символов")
-    print(f"    Палиндром : {'Да (Yes)' if results['est_palindrome'] else 'Нет (No)'}")
-    
-    print("\nЛИНГВИСТИЧЕСКИЙ АНАЛИЗ (Linguistic Analysis)")
-    print(f"    Количество гласных : {results['nombre_voyelles']}")
-    print(f"    Количество согласных : {results['nombre_consonnes']}")
-    print(f"    Уникальные буквы : {results['lettres_uniques']}")
-    
-    print("\nКИРИЛЛИЧЕСКОЕ КОДИРОВАНИЕ (Cyrillic Encoding)")
-    print(f"    Числовая последовательность : {results['sequence_cyrillique']}")
-    print(f"    Декодированное слово (проверка) : {results['mot_decode']}")
-    print(f"    Общая числовая стоимость : {results['valeur_numerique']}")
-    
-    print("\nЧИСЛОВОЙ АНАЛИЗ ОБЩЕЙ СТОИМОСТИ (Numeric Analysis of Total Value)")
-    print(f"    Десятичное : {results['decimal']}")
-    print(f"    Шестнадцатеричное : {results['hexadecimal']}")
-    print(f"    Двоичное : {results['binary']}")
-    print(f"    Восьмеричное : {results['octal']}")
-    
-    print(f"\n    Четность : {results['parity']}")
-    print(f"    Факторы : {', '.join(map(str, results['factors']))}")
-    print(f"    Простое или составное : {results['prime_status']}")
-    print(f"    Числа, делящиеся на {results['decimal']} : {', '.join(map(str, results['divisible_by_8']))}")
-    print(f"    Число {results['decimal']} умноженное на 2 :")
-    print(f"        {results['multiplied_by_2']}")
-    print(f"    Число {results['decimal']} деленное на 2 :")
-    print(f"        {results['divided_by_2']}")
-    print(f"    8 простых чисел перед числом :")
-    print(f"        {', '.join(map(str, results['previous_primes']))}")
-    print(f"    Сумма цифр : {results['digit_sum']}")
-    print(f"    Количество цифр : {results['digit_count']}")
-    print(f"    Десятичный логарифм для {results['decimal']} :")
-    print(f"        {results['log10']}")
-    print(f"    Натуральный логарифм для {results['decimal']} :")
-    print(f"        {results['natural_log']}")
-    print(f"    Число Фибоначчи? :")
-    print(f"        {'Да (Yes)' if results['fibonacci'] else 'Нет (No)'}")
-    print(f"    Следующее число после {results['decimal']} :")
-    print(f"        {results['next_number']}")
-    print(f"    Предыдущее число перед {results['decimal']} :")
-    print(f"        {results['previous_number']}")
-    
-    print("\nСТЕПЕНИ, КОРНИ (Powers, Roots)")
-    print(f"    {results['decimal']} во второй степени :")
-    print(f"        {results['square']}")
-    print(f"    {results['decimal']} в третьей степени :")
-    print(f"        {results['cube']}")
-    print(f"    Квадратный корень из {results['decimal']} :")
-    print(f"        {results['square_root']}")
-    print(f"    Кубический корень из {results['decimal']} :")
-    print(f"        {results['cube_root']}")
-    
-    print("\nТРИГОНОМЕТРИЧЕСКИЕ ФУНКЦИИ (Trigonometric Functions)")
-    print(f"    синус, sin {results['decimal']} градусов, sin {results['decimal']}° :")
-    print(f"        {results['sin_deg']:.10f}")
-    print(f"    косинус, cos {results['decimal']} градусов, cos {results['decimal']}° :")
-    print(f"        {results['cos_deg']:.10f}")
-    print(f"    тангенс, tg {results['decimal']} градусов, tg {results['decimal']}° :")
-    print(f"        {results['tan_deg']:.10f}")
-    
-    print("\nХЕШИ, КРИПТОГРАФИЯ (Hashes, Cryptography)")
-    print(f"    MD5 : {results['md5']}")
-    print(f"    CRC-32 : {results['crc32']}")
-    print(f"    SHA-256 : {results['sha256']}")
-    print(f"    Base64 : {results['base64']}")
-    
-    print("\nПРОГРАММИРОВАНИЕ (Programming)")
-    print(f"    C++ : {results['c_hex']}")
-    print(f"    Delphi : {results['delphi_hex']}")
-    
-    print("\nИНТЕРНЕТ (Internet)")
-    print(f"    IPv4 : {results['ipv4']}")
-    
-    print("\nЦВЕТ (Color)")
-    print(f"    HEX цвет : {results['color_hex']}")
-    print(f"    RGB : {results['rgb']}")
+    # Tout le rapport est accumulé puis émis en une seule écriture : une
+    # poignée d'appels d'E/S au lieu d'un par ligne affichée
+    out = []
+    out.append("="*80)
+    out.append(f"ПОЛНЫЙ АНАЛИЗ КИРИЛЛИЧЕСКОГО СЛОВА: '{results['mot_original']}'")
+    out.append(f"COMPLETE ANALYSIS OF CYRILLIC WORD: '{results['mot_original']}'")
+    out.append("="*80)
+    
+    out.append("\nОБЩАЯ ИНФОРМАЦИЯ (General Information)")
+    out.append(f"    Исходное слово : {results['mot_original']}")
+    out.append(f"    В верхнем регистре : {results['mot_majuscules']}")
+    out.append(f"    В нижнем регистре : {results['mot_minuscules']}")
+    out.append(f"    Длина слова : {results['longueur_mot']} символов")
+    out.append(f"    Палиндром : {'Да (Yes)' if results['est_palindrome'] else 'Нет (No)'}")
+    
+    out.append("\nЛИНГВИСТИЧЕСКИЙ АНАЛИЗ (Linguistic Analysis)")
+    out.append(f"    Количество гласных : {results['nombre_voyelles']}")
+    out.append(f"    Количество согласных : {results['nombre_consonnes']}")
+    out.append(f"    Уникальные буквы : {results['lettres_uniques']}")
+    
+    out.append("\nКИРИЛЛИЧЕСКОЕ КОДИРОВАНИЕ (Cyrillic Encoding)")
+    out.append(f"    Числовая последовательность : {results['sequence_cyrillique']}")
+    out.append(f"    Декодированное слово (проверка) : {results['mot_decode']}")
+    out.append(f"    Общая числовая стоимость : {results['valeur_numerique']}")
+    
+    out.append("\nЧИСЛОВОЙ АНАЛИЗ ОБЩЕЙ СТОИМОСТИ (Numeric Analysis of Total Value)")
+    out.append(f"    Десятичное : {results['decimal']}")
+    out.append(f"    Шестнадцатеричное : {results['hexadecimal']}")
+    out.append(f"    Двоичное : {results['binary']}")
+    out.append(f"    Восьмеричное : {results['octal']}")
+    
+    out.append(f"\n    Четность : {results['parity']}")
+    out.append(f"    Факторы : {', '.join(map(str, results['factors']))}")
+    out.append(f"    Простое или составное : {results['prime_status']}")
+    out.append(f"    Числа, делящиеся на {results['decimal']} : {', '.join(map(str, results['divisible_by_8']))}")
+    out.append(f"    Число {results['decimal']} умноженное на 2 :")
+    out.append(f"        {results['multiplied_by_2']}")
+    out.append(f"    Число {results['decimal']} деленное на 2 :")
+    out.append(f"        {results['divided_by_2']}")
+    out.append(f"    8 простых чисел перед числом :")
+    out.append(f"        {', '.join(map(str, results['previous_primes']))}")
+    out.append(f"    Сумма цифр : {results['digit_sum']}")
+    out.append(f"    Количество цифр : {results['digit_count']}")
+    out.append(f"    Десятичный логарифм для {results['decimal']} :")
+    out.append(f"        {results['log10']}")
+    out.append(f"    Натуральный логарифм для {results['decimal']} :")
+    out.append(f"        {results['natural_log']}")
+    out.append(f"    Число Фибоначчи? :")
+    out.append(f"        {'Да (Yes)' if results['fibonacci'] else 'Нет (No)'}")
+    out.append(f"    Следующее число после {results['decimal']} :")
+    out.append(f"        {results['next_number']}")
+    out.append(f"    Предыдущее число перед {results['decimal']} :")
+    out.append(f"        {results['previous_number']}")
+    
+    out.append("\nСТЕПЕНИ, КОРНИ (Powers, Roots)")
+    out.append(f"    {results['decimal']} во второй степени :")
+    out.append(f"        {results['square']}")
+    out.append(f"    {results['decimal']} в третьей степени :")
+    out.append(f"        {results['cube']}")
+    out.append(f"    Квадратный корень из {results['decimal']} :")
+    out.append(f"        {results['square_root']}")
+    out.append(f"    Кубический корень из {results['decimal']} :")
+    out.append(f"        {results['cube_root']}")
+    
+    out.append("\nТРИГОНОМЕТРИЧЕСКИЕ ФУНКЦИИ (Trigonometric Functions)")
+    out.append(f"    синус, sin {results['decimal']} градусов, sin {results['decimal']}° :")
+    out.append(f"        {results['sin_deg']:.10f}")
+    out.append(f"    косинус, cos {results['decimal']} градусов, cos {results['decimal']}° :")
+    out.append(f"        {results['cos_deg']:.10f}")
+    out.append(f"    тангенс, tg {results['decimal']} градусов, tg {results['decimal']}° :")
+    out.append(f"        {results['tan_deg']:.10f}")
+    
+    out.append("\nХЕШИ, КРИПТОГРАФИЯ (Hashes, Cryptography)")
+    out.append(f"    MD5 : {results['md5']}")
+    out.append(f"    CRC-32 : {results['crc32']}")
+    out.append(f"    SHA-256 : {results['sha256']}")
+    out.append(f"    Base64 : {results['base64']}")
+    
+    out.append("\nПРОГРАММИРОВАНИЕ (Programming)")
+    out.append(f"    C++ : {results['c_hex']}")
+    out.append(f"    Delphi : {results['delphi_hex']}")
+    
+    out.append("\nИНТЕРНЕТ (Internet)")
+    out.append(f"    IPv4 : {results['ipv4']}")
+    
+    out.append("\nЦВЕТ (Color)")
+    out.append(f"    HEX цвет : {results['color_hex']}")
+    out.append(f"    RGB : {results['rgb']}")
     
     # Affichage détaillé de l'encodage
-    print("\nПОДРОБНОСТИ КОДИРОВАНИЯ (Encoding Details)")
-    mot = results['mot_original'].upper()
+    out.append("\nПОДРОБНОСТИ КОДИРОВАНИЯ (Encoding Details)")
+    mot = results['mot_majuscules']
     for i, lettre in enumerate(mot):
         if lettre in ALPHABET_CYRILLIQUE:
             code = ALPHABET_CYRILLIQUE[lettre]
-            print(f"    {i+1:2d}. {lettre} = {code:2d}")
+            out.append(f"    {i+1:2d}. {lettre} = {code:2d}")
         elif lettre.isalpha():
             code = ord(lettre) - ord('A') + 1
-            print(f"    {i+1:2d}. {lettre} (латинский/latin) = {code:2d}")
+            out.append(f"    {i+1:2d}. {lettre} (латинский/latin) = {code:2d}")
+    
+    sys.stdout.write('\n'.join(out) + '\n')
 
 def main():
     if len(sys.argv) != 2:
@@ -445,7 +599,7 @@ def main():
     
     try:
         # Vérifier si c'est une séquence numérique
-        if '.' in entree and all(part.isdigit() for part in entree.split('.')):
+        if _SEQ_RE.match(entree):
             mot_decode = decoder_sequence_cyrillique(entree)
             print(f"🔓 Декодированная последовательность : {entree} → {mot_decode}")
             results = analyser_mot_cyrillique(mot_decode)
@@ -488,13 +642,13 @@ def interface_interactive():
             if not entree:
                 continue
             
-            # Analyser l'entrée
-            if '.' in entree and all(part.isdigit() for part in entree.split('.')):
+            # Analyser l'entrée (version allégée, suffisante pour le résumé)
+            if _SEQ_RE.match(entree):
                 mot_decode = decoder_sequence_cyrillique(entree)
                 print(f"🔓 Декодированная последовательность : {entree} → {mot_decode}")
-                results = analyser_mot_cyrillique(mot_decode)
+                results = analyser_mot_cyrillique_light(mot_decode)
             else:
-                results = analyser_mot_cyrillique(entree)
+                results = analyser_mot_cyrillique_light(entree)
             
             # Afficher un résumé
             print(f"\n📊 РЕЗЮМЕ ДЛЯ '{results['mot_original']}':")
@@ -506,6 +660,8 @@ def interface_interactive():
             
             voir_complet = input("\nПоказать полный анализ? (д/н): ").strip().lower()
             if voir_complet in ['д', 'да', 'y', 'yes']:
+                # L'analyse numérique complète n'est calculée qu'ici
+                results.update(analyser_nombre(results['valeur_numerique']))
                 afficher_resultats(results)
                 
         except KeyboardInterrupt:
@@ -0,0 +1,59 @@
+# cython: language_level=3
+"""
+truth_math.pyx - Noyaux arithmétiques compilés pour Truth.py
+
+Version C des boucles de division d'essai (roue 6k±1) : le modulo sur un
+long long C coûte un cycle là où le modulo sur un int Python passe par
+l'interpréteur. Compiler avec :
+
+    python setup.py build_ext --inplace
+
+Truth.py retombe automatiquement sur les versions Python pur si le module
+compilé est absent.
+"""
+
+cpdef bint is_prime(long long n):
+    """Vérifie si un nombre est premier"""
+    cdef long long d
+    cdef int pas
+    if n < 2:
+        return False
+    if n % 2 == 0:
+        return n == 2
+    if n % 3 == 0:
+        return n == 3
+    d = 5
+    pas = 2
+    while d * d <= n:
+        if n % d == 0:
+            return False
+        d += pas
+        pas = 6 - pas
+    return True
+
+cpdef list factorize(long long n):
+    """Factorise un nombre"""
+    cdef list factors
+    cdef long long d
+    cdef int pas
+    if n < 2:
+        return [n]
+
+    factors = []
+    while n % 2 == 0:
+        factors.append(2)
+        n //= 2
+    while n % 3 == 0:
+        factors.append(3)
+        n //= 3
+    d = 5
+    pas = 2
+    while d * d <= n:
+        while n % d == 0:
+            factors.append(d)
+            n //= d
+        d += pas
+        pas = 6 - pas
+    if n > 1:
+        factors.append(n)
+    return factors